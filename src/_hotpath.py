@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Per-line hot path of RWL (Run With Log)
+
+Everything here runs once per output line and is fully type annotated so the
+module can be compiled with mypyc:
+
+    pip install mypy
+    cd src && mypyc _hotpath.py
+
+The compiled extension is picked up in place of this file automatically; when
+it is not present the pure Python version below is used unchanged.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Set, Tuple
+
+from rich.text import Text
+
+# Optional: pyahocorasick matches all keywords in one pass, whatever their number
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+# Below this many keywords a substring test per keyword beats an automaton pass
+AUTOMATON_MIN_KEYWORDS = 8
+
+
+ANSI_RE_B = re.compile(rb'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+
+def strip_ansi_bytes(raw: bytes) -> str:
+    """Decode a raw output line as UTF-8, removing ANSI escape codes"""
+    # memchr fast path: lines without ESC are decoded directly
+    if 0x1b not in raw:
+        return raw.decode('utf-8', errors='replace')
+    return ANSI_RE_B.sub(b'', raw).decode('utf-8', errors='replace')
+
+
+class KeywordMatcher:
+    """Compiled matchers for the enabled keywords of a config"""
+
+    def __init__(self, keywords: List[Tuple[str, str]]) -> None:
+        """keywords are (keyword, color) pairs, highlighting is applied in this order"""
+        enabled = [kw for kw in keywords if kw[0]]
+
+        self.names: Tuple[str, ...] = tuple(kw for kw, _ in enabled)
+        self.styles: Tuple[str, ...] = tuple(f"bold {color}" for _, color in enabled)
+        # Lowercased keywords for a cheap "may match" check
+        self.lowers: Tuple[str, ...] = tuple(kw.lower() for kw in self.names)
+
+        # One pattern per keyword, so keywords contained in one another are all found
+        self.patterns: Tuple[Pattern, ...] = tuple(
+            re.compile(re.escape(keyword), re.IGNORECASE) for keyword in self.names
+        )
+
+        # Aho-Corasick automaton over the lowercased keywords, if available and worth it.
+        # Each distinct lowercased keyword maps to the ids of the keywords sharing it
+        self.automaton: Any = None
+        if ahocorasick is not None and len(self.names) >= AUTOMATON_MIN_KEYWORDS:
+            ids_by_lower: Dict[str, List[int]] = {}
+            for i, lowered in enumerate(self.lowers):
+                ids_by_lower.setdefault(lowered, []).append(i)
+            automaton = ahocorasick.Automaton()
+            for lowered, ids in ids_by_lower.items():
+                automaton.add_word(lowered, tuple(ids))
+            automaton.make_automaton()
+            self.automaton = automaton
+
+    def highlight(self, text: Text, line: str) -> Iterable[Tuple[str, int]]:
+        """
+        Stylize keyword matches of line in text.
+        Returns (keyword, count) pairs, each keyword found counts once per line.
+        """
+        if not self.names:
+            return ()
+
+        lowered = line.lower()
+        names = self.names
+        # Created on the first hit, lines without a match allocate no result
+        found: Optional[List[Tuple[str, int]]] = None
+
+        if self.automaton is not None:
+            # One pass over the line, only keywords it hit are searched for, in config order
+            hits: Optional[Set[int]] = None
+            for _, ids in self.automaton.iter(lowered):
+                if hits is None:
+                    hits = set()
+                hits.update(ids)
+            if hits is None:
+                return ()
+            for i in sorted(hits):
+                if self._stylize_keyword(i, text, line):
+                    if found is None:
+                        found = []
+                    found.append((names[i], 1))
+        else:
+            # Most lines contain no keyword at all, only keywords that occur are searched for
+            for i, lowered_keyword in enumerate(self.lowers):
+                if lowered_keyword in lowered and self._stylize_keyword(i, text, line):
+                    if found is None:
+                        found = []
+                    found.append((names[i], 1))
+        return found if found is not None else ()
+
+    def _stylize_keyword(self, i: int, text: Text, line: str) -> bool:
+        """Stylize every match of keyword i in text, returns whether there was one"""
+        style = self.styles[i]
+        matched = False
+        for match in self.patterns[i].finditer(line):
+            matched = True
+            text.stylize(style, *match.span())
+        return matched
+
+
+def format_display_line(timestamp: str, line: Text) -> Text:
+    """Format a highlighted line for display, timestamp may be empty"""
+    if not timestamp:
+        return line
+    return Text.assemble((f"[{timestamp}] ", "dim"), line)
+
+
+def format_log_line(timestamp: str, line: str) -> str:
+    """Format a line for the log file, timestamp may be empty"""
+    if not timestamp:
+        return line + "\n"
+    return f"[{timestamp}] {line}\n"
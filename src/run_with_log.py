@@ -9,54 +9,211 @@ Version: 1.0.0
 import os
 import sys
 import time
-import signal
-import shlex
-import yaml
-import json
+import pickle
+import hashlib
+import threading
+import functools
+import asyncio
 import subprocess
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional, Any, Set
+from typing import Dict, List, Tuple, Optional, Any, Set, Union, Iterator, Iterable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
-from collections import defaultdict
-from threading import Thread, Event
-import queue
-import re
+from collections import defaultdict, deque
+from collections.abc import MutableMapping
+from itertools import islice
+
 
 # Third-party imports
+# Only what the `rwl <command>` path needs is imported here; yaml, inquirer
+# and rarely used rich modules are imported where they are first needed.
 try:
     from rich.console import Console
     from rich.panel import Panel
     from rich.live import Live
     from rich.layout import Layout
     from rich.text import Text
-    from rich.table import Table
-    from rich.columns import Columns
-    from rich.progress import Progress, SpinnerColumn, TextColumn
-    from rich.syntax import Syntax
-    from rich import box
     from rich.style import Style
-    from rich.rule import Rule
-    from rich.prompt import Prompt, Confirm
-    from rich.console import Group
-    from rich.align import Align
 except ImportError as e:
     print(f"Error: rich library is required. Please install with: pip install rich==1.12.0")
     sys.exit(1)
 
-try:
-    import inquirer
-    from inquirer.themes import Theme, load_theme_from_dict
-except ImportError as e:
-    print(f"Error: inquirer library is required. Please install with: pip install inquirer==2.8.0")
-    sys.exit(1)
+# Per-line processing, compiled with mypyc when the extension has been built
+from _hotpath import strip_ansi_bytes, KeywordMatcher, format_display_line, format_log_line
+
+
+# Editors tried in order by the configuration editor
+EDITORS = ('nvim', 'vim', 'vi', 'nano', 'code', 'subl')
+
+
+@functools.lru_cache(maxsize=None)
+def _which(program: str) -> Optional[str]:
+    """Find executable in PATH, cached for the lifetime of the process"""
+    import shutil
+    return shutil.which(program)
+
+
+def _import_yaml():
+    """Import PyYAML with its fastest safe loader and dumper, only needed on cache misses and saves"""
+    import yaml
+    # Prefer the libyaml C bindings when PyYAML was built with them
+    try:
+        from yaml import CSafeLoader as Loader, CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeLoader as Loader, SafeDumper as Dumper
+    return yaml, Loader, Dumper
+
+
+def _import_inquirer():
+    """Import inquirer on first use of an interactive menu"""
+    try:
+        import inquirer
+    except ImportError as e:
+        print(f"Error: inquirer library is required. Please install with: pip install inquirer==2.8.0")
+        sys.exit(1)
+    return inquirer
+
+
+# Styles used by the info panel
+_DEFAULT_KEYWORD_STYLE = Style(color="white")
+_STATUS_DONE_STYLE = Style(color="green")
+_STATUS_RUNNING_STYLE = Style(color="yellow")
+
+# Live display refresh cadence, read size and buffer limit for process output streams
+_LIVE_REFRESH_INTERVAL = 0.1
+_STREAM_READ_SIZE = 1 << 16
+_STREAM_LIMIT = 1 << 20
 
+# Log files are written through a large buffer and flushed on a timer
+_LOG_BUFFER_SIZE = 1 << 16
+_LOG_FLUSH_INTERVAL = 1.0
+
+
+def _run_coroutine(coro) -> Any:
+    """Run a coroutine on a fresh event loop (asyncio.run needs Python 3.7)"""
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        try:
+            # Like asyncio.run, cancel what is left (e.g. after Ctrl+C) so it can clean up
+            all_tasks = getattr(asyncio, 'all_tasks', None) or asyncio.Task.all_tasks
+            pending = [task for task in all_tasks(loop) if not task.done()]
+            for task in pending:
+                task.cancel()
+            if pending:
+                loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+            loop.run_until_complete(loop.shutdown_asyncgens())
+        finally:
+            asyncio.set_event_loop(None)
+            loop.close()
+
+
+_HELP_TEXT = """
+[bold cyan]RWL - Run With Log[/bold cyan]
+A tool to capture and log program output with real-time display
+
+[bold]Usage:[/bold]
+  rwl [options] <command> [args...]
+  python run_with_log.py [options] <command> [args...]
+
+[bold]Options:[/bold]
+  -h, --help        Show this help message
+  --config          Interactive configuration management
+  --setting         Configure output panel settings
 
-def strip_ansi_codes(text: str) -> str:
-    """Remove ANSI escape codes from text"""
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+[bold]Examples:[/bold]
+  rwl make all              # Run command with logging
+  rwl --config              # Open configuration manager
+  rwl --setting             # Configure panel settings
+  rwl gcc -o test test.c    # Compile with logging
+
+[bold]Features:[/bold]
+  • Real-time output capture and display
+  • Configurable logging profiles
+  • Keyword highlighting (errors, warnings, etc.)
+  • Statistics and metrics
+  • Silent mode for background operations
+  • Interactive configuration management
+  • Final summary display with all statistics
+
+[bold]Configuration:[/bold]
+  Configuration is stored in rwl.yaml in the same directory as the tool.
+  Multiple profiles can be created and switched between.
+
+[bold]Keyboard Controls:[/bold]
+  • Ctrl+C to interrupt the running process
+  • Output panel auto-scrolls to show latest output
+  • After process completion, press Enter to exit
+"""
+
+
+def _make_console() -> Console:
+    """Create a console for already marked up output, without the auto highlighter"""
+    return Console(highlight=False, log_time=False, log_path=False)
+
+
+def _print_help_static(console: Optional[Console] = None) -> None:
+    """Print the help panel, without setting up an RWLTool for it"""
+    if console is None:
+        console = _make_console()
+    console.print(Panel(_HELP_TEXT, title="Help", border_style="cyan"))
+
+
+# On-disk cache of parsed YAML files, one pickle per content hash, least recently used pruned first
+_YAML_CACHE_DIR = Path("~/.cache/rwl").expanduser()
+_YAML_CACHE_MAX = 100
+
+
+def _prune_yaml_cache() -> None:
+    """Keep only the most recently used cache entries"""
+    try:
+        entries = sorted(_YAML_CACHE_DIR.glob("config.*.pkl"), key=lambda p: p.stat().st_mtime)
+        for entry in entries[:-_YAML_CACHE_MAX]:
+            entry.unlink()
+    except OSError:
+        pass
+
+
+def _load_config_cached(path: Path) -> Any:
+    """Load a YAML file, skipping the parse when its content was seen before"""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_path = _YAML_CACHE_DIR / f"config.{digest}.pkl"
+    
+    try:
+        with open(cache_path, 'rb') as f:
+            data = pickle.load(f)
+    except Exception:
+        pass
+    else:
+        # Touch the entry so pruning evicts least recently used entries first
+        try:
+            os.utime(cache_path)
+        except OSError:
+            pass
+        return data
+    
+    yaml, loader, _ = _import_yaml()
+    data = yaml.load(raw, Loader=loader)
+    
+    # Write atomically so concurrent runs never see a partial pickle,
+    # a failure here only costs a reparse next time
+    try:
+        _YAML_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(temp_path, cache_path)
+        _prune_yaml_cache()
+    except Exception:
+        pass
+    
+    return data
 
 
 class LogLevel(Enum):
@@ -82,6 +239,9 @@ class Config:
     log_dir: str = "~/logs/"
     description: str = ""
     keywords: Dict[str, KeywordConfig] = field(default_factory=dict)
+    # Keyword lines of the configuration view, built on first view. Never reset:
+    # keywords are not mutated in place, edits replace the whole Config
+    _rendered_keywords: Optional[str] = field(default=None, init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
         """Convert config to dictionary for YAML serialization"""
@@ -111,6 +271,41 @@ class Config:
         )
 
 
+class LazyConfigs(MutableMapping):
+    """Configs by name, each parsed from its raw dict only on first access"""
+    
+    def __init__(self, configs: Optional[Dict[str, Union[Config, Dict]]] = None):
+        # Values are raw dicts until accessed, then the parsed Config
+        self._configs: Dict[str, Union[Config, Dict]] = dict(configs or {})
+    
+    def __getitem__(self, name: str) -> Config:
+        config = self._configs[name]
+        if not isinstance(config, Config):
+            config = Config.from_dict(name, config)
+            self._configs[name] = config
+        return config
+    
+    def __setitem__(self, name: str, config: Config) -> None:
+        self._configs[name] = config
+    
+    def __delitem__(self, name: str) -> None:
+        del self._configs[name]
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._configs)
+    
+    def __len__(self) -> int:
+        return len(self._configs)
+    
+    def __contains__(self, name: object) -> bool:
+        return name in self._configs
+    
+    def to_dict(self) -> Dict[str, Dict]:
+        """Convert all configs to dictionaries, unparsed ones are passed through"""
+        return {name: config.to_dict() if isinstance(config, Config) else config
+                for name, config in self._configs.items()}
+
+
 @dataclass
 class Statistics:
     """Runtime statistics"""
@@ -139,15 +334,16 @@ class OutputPanel:
     def __init__(self, height: int = 20, width: Optional[int] = None):
         self.height = height
         self.width = width
-        self.lines = []
         self.max_lines = height - 2  # Account for borders
+        # (timestamp, highlighted line) pairs, bounded to keep some history
+        self.lines: deque = deque(maxlen=max(self.max_lines * 3, 64))
         self.scroll_offset = 0
+        self.dirty = True  # Set whenever the visible content may have changed
         
-    def add_line(self, line: str) -> None:
-        """Add a line to the panel"""
-        self.lines.append(line)
-        if len(self.lines) > self.max_lines * 3:  # Keep some history
-            self.lines = self.lines[-self.max_lines * 3:]
+    def add_line(self, timestamp: str, line: Text) -> None:
+        """Add a highlighted line to the panel, timestamp may be empty"""
+        self.lines.append((timestamp, line))
+        self.dirty = True
         
         # Auto-scroll to show latest
         if len(self.lines) > self.max_lines:
@@ -157,11 +353,13 @@ class OutputPanel:
         """Scroll up in the panel"""
         if self.scroll_offset > 0:
             self.scroll_offset -= 1
+            self.dirty = True
     
     def scroll_down(self) -> None:
         """Scroll down in the panel"""
         if self.scroll_offset < len(self.lines) - self.max_lines:
             self.scroll_offset += 1
+            self.dirty = True
     
     def scroll_to_bottom(self) -> None:
         """Scroll to the bottom"""
@@ -169,27 +367,26 @@ class OutputPanel:
             self.scroll_offset = len(self.lines) - self.max_lines
         else:
             self.scroll_offset = 0
+        self.dirty = True
     
     def scroll_to_top(self) -> None:
         """Scroll to the top"""
         self.scroll_offset = 0
+        self.dirty = True
     
     def render(self) -> Panel:
         """Render the panel as a Rich Panel"""
         # Get visible lines
         start = self.scroll_offset
         end = min(start + self.max_lines, len(self.lines))
-        visible_lines = self.lines[start:end]
+        visible_lines = [format_display_line(ts, line) for ts, line in islice(self.lines, start, end)]
         
-        # Create text with proper styling
-        text = Text()
-        for line in visible_lines:
-            text.append(line + "\n")
+        # Lines are already styled, just join them
+        text = Text("\n").join(visible_lines)
         
         # Add scroll indicator
         if len(self.lines) > self.max_lines:
             total_lines = len(self.lines)
-            percent = (self.scroll_offset / (total_lines - self.max_lines)) * 100
             scroll_info = f" [{self.scroll_offset+1}-{end}/{total_lines}]"
         else:
             scroll_info = f" [1-{len(self.lines)}/{len(self.lines)}]"
@@ -206,19 +403,32 @@ class RWLTool:
     """Main RWL Tool class"""
     
     def __init__(self):
-        self.console = Console()
+        self.console = _make_console()
         self.config_path = self._get_fixed_config_path()  # 使用固定路径
-        self.configs: Dict[str, Config] = {}
+        self.configs: LazyConfigs = LazyConfigs()
         self.current_config_name: str = "default"
+        self._save_lock = threading.Lock()
         self.current_config: Optional[Config] = None
         self.settings: Dict[str, Any] = {"panel_height": 20}  # Default panel height
         self.output_panel: Optional[OutputPanel] = None
         self.statistics: Optional[Statistics] = None
         self.running = False
-        self.process: Optional[subprocess.Popen] = None
-        self.output_queue = queue.Queue()
-        self.stop_event = Event()
+        self.process: Optional[asyncio.subprocess.Process] = None
+        self._output_event: Optional[asyncio.Event] = None
+        # Set when statistics changed since the info panel was last drawn
+        self._stats_dirty = False
+        # (epoch second, formatted "%H:%M:%S") reused for all lines within that second
+        self._ts_cache: Tuple[int, str] = (0, "")
         self.log_path: Optional[Path] = None
+        # Compiled matchers for the enabled keywords of current_config
+        self._keyword_matcher: Optional[KeywordMatcher] = None
+        # Pre-built pieces of the info panel for current_config
+        self._keyword_styles: Dict[str, Style] = {}
+        self._info_header: Optional[List[Text]] = None
+        self._info_keywords: Tuple[int, Optional[Text]] = (-1, None)
+        # Config names offered by the menus, rebuilt when configs are added or removed
+        self._config_names_cached: Optional[List[str]] = None
+        self._deletable_names_cached: Optional[List[str]] = None
         
         # Default keywords if not configured
         self.default_keywords = {
@@ -282,17 +492,17 @@ class RWLTool:
             }
         }
         
+        yaml, _, dumper = _import_yaml()
         config_path.parent.mkdir(parents=True, exist_ok=True)
         with open(config_path, 'w') as f:
-            yaml.dump(default_config, f, default_flow_style=False)
+            yaml.dump(default_config, f, Dumper=dumper, default_flow_style=False)
         
         self.console.print(f"[green]Created default configuration at: {config_path}[/green]")
     
     def _load_config(self) -> None:
         """Load configuration from YAML file"""
         try:
-            with open(self.config_path, 'r') as f:
-                config_data = yaml.safe_load(f)
+            config_data = _load_config_cached(self.config_path)
             
             if not config_data:
                 raise ValueError("Configuration file is empty")
@@ -300,10 +510,9 @@ class RWLTool:
             # Load settings
             self.settings = config_data.get("settings", {"panel_height": 20})
             
-            # Load all configs
-            self.configs.clear()
-            for name, config_dict in config_data.get("configs", {}).items():
-                self.configs[name] = Config.from_dict(name, config_dict)
+            # Index all configs, only the current one is parsed below
+            self.configs = LazyConfigs(config_data.get("configs", {}))
+            self._invalidate_name_caches()
             
             # Set current config
             self.current_config_name = config_data.get("current", "default")
@@ -311,6 +520,7 @@ class RWLTool:
                 self.current_config_name = "default"
             
             self.current_config = self.configs.get(self.current_config_name)
+            self._rebuild_keyword_regex()
             
             # Ensure default config exists
             if "default" not in self.configs:
@@ -322,6 +532,7 @@ class RWLTool:
                     description="Default configuration",
                     keywords=self.default_keywords
                 )
+                self._invalidate_name_caches()
                 self._save_config()
             
         except FileNotFoundError:
@@ -332,7 +543,7 @@ class RWLTool:
             self.console.print(f"[red]Error loading config: {e}[/red]")
             # Create default config
             self.settings = {"panel_height": 20}
-            self.configs = {
+            self.configs = LazyConfigs({
                 "default": Config(
                     name="default",
                     timestamp=True,
@@ -341,21 +552,38 @@ class RWLTool:
                     description="Default configuration",
                     keywords=self.default_keywords
                 )
-            }
+            })
+            self._invalidate_name_caches()
             self.current_config = self.configs["default"]
             self.current_config_name = "default"
+            self._rebuild_keyword_regex()
             self._save_config()
     
     def _save_config(self) -> None:
         """Save configuration to YAML file"""
-        config_data = {
-            "current": self.current_config_name,
-            "settings": self.settings,
-            "configs": {name: config.to_dict() for name, config in self.configs.items()}
-        }
-        
-        with open(self.config_path, 'w') as f:
-            yaml.dump(config_data, f, default_flow_style=False)
+        yaml, _, dumper = _import_yaml()
+        
+        # Saves may run in a background thread, never interleave two of them
+        with self._save_lock:
+            config_data = {
+                "current": self.current_config_name,
+                "settings": self.settings,
+                "configs": self.configs.to_dict()
+            }
+            
+            # Write atomically, readers never see a half written file,
+            # the pid keeps concurrent rwl processes off each other's temp file.
+            # Replace the real file, not a symlink pointing at it
+            target = Path(os.path.realpath(self.config_path))
+            temp_path = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            try:
+                with open(temp_path, 'w') as f:
+                    yaml.dump(config_data, f, Dumper=dumper, default_flow_style=False)
+                os.replace(temp_path, target)
+            except BaseException:
+                if temp_path.exists():
+                    temp_path.unlink()
+                raise
     
     def _expand_path(self, path: str) -> Path:
         """Expand user and environment variables in path"""
@@ -377,102 +605,187 @@ class RWLTool:
         
         return config_dir / filename
     
-    def _apply_keyword_highlighting_to_text(self, text: Text, line: str) -> Tuple[Text, Dict[str, int]]:
-        """
-        Apply keyword highlighting to a Rich Text object.
-        Returns highlighted Text and keyword counts.
-        """
+    def _rebuild_keyword_regex(self) -> None:
+        """Compile enabled keywords of current_config into a single matcher"""
+        self._keyword_matcher = None
+        self._keyword_styles = {}
+        self._info_header = None
+        self._info_keywords = (-1, None)
         if not self.current_config:
-            return text, {}
+            return
         
-        keyword_counts = defaultdict(int)
+        self._keyword_styles = {kw: Style(color=cfg.color)
+                                for kw, cfg in self.current_config.keywords.items()}
         
-        for keyword, kw_config in self.current_config.keywords.items():
-            if not kw_config.enabled:
-                continue
-            
-            # Case-insensitive search for keyword
-            pattern = re.compile(re.escape(keyword), re.IGNORECASE)
-            matches = list(pattern.finditer(line))
-            
-            if matches:
-                keyword_counts[keyword] += 1
-                
-                # Apply highlighting
-                for match in matches:
-                    start, end = match.span()
-                    text.stylize(f"bold {kw_config.color}", start, end)
+        self._keyword_matcher = KeywordMatcher([
+            (kw, cfg.color) for kw, cfg in self.current_config.keywords.items() if cfg.enabled
+        ])
+    
+    def _apply_keyword_highlighting_to_text(self, text: Text, line: str) -> Tuple[Text, Iterable[Tuple[str, int]]]:
+        """
+        Apply keyword highlighting to a Rich Text object.
+        Returns highlighted Text and (keyword, count) pairs.
+        """
+        if not self.current_config or self._keyword_matcher is None:
+            return text, ()
         
-        return text, keyword_counts
+        return text, self._keyword_matcher.highlight(text, line)
+    
+    def _get_timestamp(self) -> str:
+        """Get the current "%H:%M:%S" timestamp, formatted once per second"""
+        sec = int(time.time())
+        if sec != self._ts_cache[0]:
+            self._ts_cache = (sec, time.strftime("%H:%M:%S", time.localtime(sec)))
+        return self._ts_cache[1]
     
-    def _process_output_line(self, line: str, log_file) -> None:
-        """Process a single line of output"""
+    def _process_output_line(self, line: bytes, log_file) -> None:
+        """Process a single raw line of output, without its line ending"""
         if not line:
             return
         
-        # Remove ANSI color codes
-        clean_line = strip_ansi_codes(line)
+        # Decode and remove ANSI color codes
+        clean_line = strip_ansi_bytes(line)
         
-        # Add timestamp if enabled
+        # Add timestamp if enabled, it is prefixed when rendering or logging
         if self.current_config and self.current_config.timestamp:
-            timestamp = datetime.now().strftime("%H:%M:%S")
-            displayed_line = f"[{timestamp}] {clean_line}"
-            log_line = f"[{timestamp}] {clean_line}"
+            timestamp = self._get_timestamp()
         else:
-            displayed_line = clean_line
-            log_line = clean_line
+            timestamp = ""
         
         # Create Text object and apply keyword highlighting
-        text_line = Text(displayed_line)
-        keyword_counts = {}
+        text_line = Text(clean_line)
+        keyword_counts: Iterable[Tuple[str, int]] = ()
         
         if self.current_config:
-            text_line, keyword_counts = self._apply_keyword_highlighting_to_text(text_line, displayed_line)
+            text_line, keyword_counts = self._apply_keyword_highlighting_to_text(text_line, clean_line)
         
         # Update statistics
         if self.statistics:
             self.statistics.lines_processed += 1
-            for keyword, count in keyword_counts.items():
+            self._stats_dirty = True
+            for keyword, count in keyword_counts:
                 self.statistics.keyword_counts[keyword] += count
         
         # Write to log file (without color codes)
         if log_file:
-            log_file.write(log_line + "\n")
-            log_file.flush()
+            log_file.write(format_log_line(timestamp, clean_line))
         
         # Add to output panel if not silent
         if not (self.current_config and self.current_config.silent):
-            # Store the plain text for panel display
-            self.output_panel.add_line(displayed_line)
-            # Queue the highlighted version for display
-            self.output_queue.put(("output", text_line))
-    
-    def _read_process_output(self, process, stdout, stderr, log_file) -> None:
-        """Read output from process stdout and stderr"""
-        import select
-        
-        while not self.stop_event.is_set() and process.poll() is None:
-            # Use select to check if there's data to read
-            readers, _, _ = select.select([stdout, stderr], [], [], 0.1)
+            # Store the highlighted text for panel display
+            self.output_panel.add_line(timestamp, text_line)
+    
+    async def _consume_stream(self, stream: asyncio.StreamReader, log_file) -> None:
+        """Process lines from a process stream as soon as they arrive"""
+        # Split lines ourselves, readline() drops data on lines longer than the limit
+        buffer = bytearray()
+        while True:
+            chunk = await stream.read(_STREAM_READ_SIZE)
+            if not chunk:
+                break
+            buffer += chunk
+            # Universal newlines: \n, \r\n and a lone \r all end a line.
+            # A trailing \r may be the first half of a \r\n, keep it for the next chunk
+            cut = len(buffer) - 1 if buffer.endswith(b'\r') else len(buffer)
+            end = max(buffer.rfind(b'\n', 0, cut), buffer.rfind(b'\r', 0, cut))
+            if end < 0:
+                continue
+            complete = bytes(buffer[:end])
+            del buffer[:end + 1]
+            self._process_output_block(complete, log_file)
+        
+        # Last line without a line ending
+        if buffer:
+            self._process_output_block(bytes(buffer), log_file)
+    
+    def _process_output_block(self, block: bytes, log_file) -> None:
+        """Process complete lines of output, separated by any line ending"""
+        for raw in block.replace(b'\r\n', b'\n').replace(b'\r', b'\n').split(b'\n'):
+            self._process_output_line(raw, log_file)
+        self._output_event.set()
+    
+    async def _run_process(self, cmd: List[str], log_file, layout: Optional[Layout] = None,
+                           live: Optional[Live] = None) -> int:
+        """Run command and process its output, refreshing the live display if given"""
+        self.process = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
+            limit=_STREAM_LIMIT
+        )
+        
+        # Initialize statistics
+        self.statistics = Statistics(start_time=time.time())
+        self._output_event = asyncio.Event()
+        
+        flush_task = asyncio.ensure_future(self._flush_log_periodically(log_file))
+        display_task = None
+        if live is not None:
+            display_task = asyncio.ensure_future(self._refresh_live_display(layout, live))
+        
+        try:
+            await asyncio.gather(
+                self._consume_stream(self.process.stdout, log_file),
+                self._consume_stream(self.process.stderr, log_file)
+            )
+            return await self.process.wait()
+        except asyncio.CancelledError:
+            # Interrupted (Ctrl+C), don't leave the child running
+            if self.process.returncode is None:
+                try:
+                    self.process.terminate()
+                    await asyncio.wait_for(self.process.wait(), timeout=5)
+                except (ProcessLookupError, asyncio.TimeoutError):
+                    pass
+            raise
+        finally:
+            flush_task.cancel()
+            if display_task:
+                display_task.cancel()
+    
+    async def _flush_log_periodically(self, log_file) -> None:
+        """Flush buffered log output so the file can be followed while running"""
+        while True:
+            await asyncio.sleep(_LOG_FLUSH_INTERVAL)
+            log_file.flush()
+    
+    def _get_info_header(self) -> List[Text]:
+        """Get the configuration and settings lines of the info panel"""
+        if self._info_header is None:
+            config = self.current_config
+            
+            # Configuration info
+            config_line = Text(f"Configuration: {config.name}")
+            if config.description:
+                config_line.append(f" - {config.description}")
+            
+            # Settings
+            settings_line = Text(", ".join([
+                f"Log: {config.log_dir}",
+                f"Timestamp: {'✓' if config.timestamp else '✗'}",
+                f"Silent: {'✓' if config.silent else '✗'}"
+            ]))
+            
+            self._info_header = [config_line, settings_line]
+        return self._info_header
+    
+    def _get_info_keywords(self) -> Optional[Text]:
+        """Get the keyword counts line, rebuilt only when new lines were processed"""
+        lines_processed = self.statistics.lines_processed
+        if self._info_keywords[0] != lines_processed:
+            keyword_parts = []
+            for keyword, count in self.statistics.keyword_counts.items():
+                if count > 0:
+                    if keyword_parts:
+                        keyword_parts.append(", ")
+                    style = self._keyword_styles.get(keyword, _DEFAULT_KEYWORD_STYLE)
+                    keyword_parts.append((f"{keyword}: {count}", style))
             
-            for reader in readers:
-                if reader == stdout:
-                    line = stdout.readline()
-                    if line:
-                        self._process_output_line(line.rstrip('\n'), log_file)
-                elif reader == stderr:
-                    line = stderr.readline()
-                    if line:
-                        self._process_output_line(line.rstrip('\n'), log_file)
-        
-        # Read any remaining output
-        for line in iter(stdout.readline, ''):
-            if line:
-                self._process_output_line(line.rstrip('\n'), log_file)
-        
-        for line in iter(stderr.readline, ''):
-            if line:
-                self._process_output_line(line.rstrip('\n'), log_file)
+            keywords_line = None
+            if keyword_parts:
+                keywords_line = Text.assemble("          Keywords: ", *keyword_parts)
+            self._info_keywords = (lines_processed, keywords_line)
+        return self._info_keywords[1]
     
     def _create_info_panel(self, is_final: bool = False) -> Panel:
         """Create information panel with config and stats"""
@@ -480,85 +793,66 @@ class RWLTool:
             return Panel("", title="Run Information", border_style="blue")
         
         # Build info text
-        info_lines = []
-        
-        # Configuration info
-        config_line = f"Configuration: {self.current_config.name}"
-        if self.current_config.description:
-            config_line += f" - {self.current_config.description}"
-        info_lines.append(config_line)
-        
-        # Settings
-        settings = []
-        settings.append(f"Log: {self.current_config.log_dir}")
-        settings.append(f"Timestamp: {'✓' if self.current_config.timestamp else '✗'}")
-        settings.append(f"Silent: {'✓' if self.current_config.silent else '✗'}")
-        info_lines.append(", ".join(settings))
+        info_lines = list(self._get_info_header())
         
         # Statistics
         elapsed = self.statistics.elapsed_time
-        status_text = "[green]✓ Completed[/green]" if is_final else "[yellow]● Running[/yellow]"
-        stats_line = f"Statistics: {status_text}, Time: {elapsed:.2f}s, Lines: {self.statistics.lines_processed}"
-        info_lines.append(stats_line)
+        status = ("✓ Completed", _STATUS_DONE_STYLE) if is_final else ("● Running", _STATUS_RUNNING_STYLE)
+        info_lines.append(Text.assemble(
+            "Statistics: ", status,
+            f", Time: {elapsed:.2f}s, Lines: {self.statistics.lines_processed}"
+        ))
         
         # Keyword counts
-        keyword_strs = []
-        for keyword, count in self.statistics.keyword_counts.items():
-            if count > 0:
-                color = self.current_config.keywords.get(keyword, KeywordConfig(color="white")).color
-                keyword_strs.append(f"[{color}]{keyword}: {count}[/{color}]")
-        
-        if keyword_strs:
-            keywords_line = "          Keywords: " + ", ".join(keyword_strs)
+        keywords_line = self._get_info_keywords()
+        if keywords_line is not None:
             info_lines.append(keywords_line)
         
         # Log file info for final display
         if is_final and self.log_path:
-            info_lines.append("")
-            info_lines.append(f"Log saved to: {self.log_path}")
+            info_lines.append(Text())
+            info_lines.append(Text(f"Log saved to: {self.log_path}"))
         
         # Create panel
-        panel_content = "\n".join(info_lines)
+        panel_content = Text("\n").join(info_lines)
         
         if is_final:
             return Panel(panel_content, title="Final Statistics", border_style="green", padding=(0, 1))
         else:
             return Panel(panel_content, title="Run Information", border_style="blue", padding=(0, 1))
     
-    def _create_highlighted_output_panel(self) -> Panel:
-        """Create output panel with keyword highlighting applied"""
-        if not self.output_panel:
-            return Panel("", title="Program Output", border_style="cyan")
-        
-        # Get visible lines
-        start = self.output_panel.scroll_offset
-        end = min(start + self.output_panel.max_lines, len(self.output_panel.lines))
-        visible_lines = self.output_panel.lines[start:end]
-        
-        # Create text with keyword highlighting
-        text = Text()
-        for i, line in enumerate(visible_lines):
-            # Apply keyword highlighting to each line
-            line_text = Text(line)
-            if self.current_config:
-                line_text, _ = self._apply_keyword_highlighting_to_text(line_text, line)
-            text.append(line_text)
-            if i < len(visible_lines) - 1:
-                text.append("\n")
-        
-        # Add scroll indicator
-        if len(self.output_panel.lines) > self.output_panel.max_lines:
-            total_lines = len(self.output_panel.lines)
-            scroll_info = f" [{start+1}-{end}/{total_lines}]"
-        else:
-            scroll_info = f" [1-{len(self.output_panel.lines)}/{len(self.output_panel.lines)}]"
-        
-        return Panel(
-            text,
-            title=f"Program Output{scroll_info}",
-            border_style="cyan",
-            height=self.output_panel.height
-        )
+    async def _refresh_live_display(self, layout: Layout, live: Live) -> None:
+        """Redraw the live layout when new output lands, at most refresh_per_second"""
+        last_info_update = 0.0
+        while True:
+            changed = False
+            
+            # Update info panel when statistics changed, or once a second for the timer
+            now = time.time()
+            if self._stats_dirty or now - last_info_update >= 1.0:
+                self._stats_dirty = False
+                last_info_update = now
+                layout["info"].update(self._create_info_panel(is_final=False))
+                changed = True
+            
+            # Update output panel only when its content changed
+            if self.output_panel.dirty:
+                self.output_panel.dirty = False
+                layout["output"].update(self.output_panel.render())
+                changed = True
+            
+            # Nothing to redraw on quiet ticks
+            if changed:
+                live.refresh()
+            
+            # Wait for new output, waking up once a second to keep the timer moving
+            try:
+                await asyncio.wait_for(self._output_event.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+            self._output_event.clear()
+            
+            await asyncio.sleep(_LIVE_REFRESH_INTERVAL)
     
     def _run_with_live_display(self, cmd: List[str], program_name: str) -> int:
         """Run command with live display"""
@@ -570,34 +864,14 @@ class RWLTool:
         self.log_path = self._get_log_file_path(program_name)
         
         # Open log file
-        log_file = open(self.log_path, 'w')
-        
-        # Start process
-        self.process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            universal_newlines=True,
-            bufsize=1
-        )
+        log_file = open(self.log_path, 'w', buffering=_LOG_BUFFER_SIZE)
         
-        # Initialize statistics
-        self.statistics = Statistics(start_time=time.time())
         self.running = True
-        self.stop_event.clear()
         
         # Reset output panel for new run
         if self.output_panel:
             self.output_panel = OutputPanel(height=self.settings.get("panel_height", 20))
         
-        # Start output reader thread
-        reader_thread = Thread(
-            target=self._read_process_output,
-            args=(self.process, self.process.stdout, self.process.stderr, log_file),
-            daemon=True
-        )
-        reader_thread.start()
-        
         # Create layout for live display
         layout = Layout()
         layout.split_column(
@@ -605,48 +879,21 @@ class RWLTool:
             Layout(name="output", ratio=1)  # Output panel
         )
         
-        # Main display loop
-        with Live(layout, console=self.console, refresh_per_second=10, screen=True) as live:
-            try:
-                while self.process.poll() is None and not self.stop_event.is_set():
-                    # Update info panel
-                    layout["info"].update(self._create_info_panel(is_final=False))
-                    
-                    # Update output panel with keyword highlighting
-                    layout["output"].update(self._create_highlighted_output_panel())
-                    
-                    # Check for new output
-                    try:
-                        while True:
-                            msg_type, content = self.output_queue.get_nowait()
-                            if msg_type == "output":
-                                # Output is already added to panel, just refresh
-                                pass
-                    except queue.Empty:
-                        pass
-                    
-                    time.sleep(0.1)
-                
-                # Process any remaining output
-                reader_thread.join(timeout=1)
-                
-            except KeyboardInterrupt:
-                self.console.print("\n[yellow]Interrupted by user, terminating process...[/yellow]")
-                if self.process and self.process.poll() is None:
-                    self.process.terminate()
-                    self.process.wait(timeout=5)
-        
-        # Cleanup
-        self.running = False
-        self.stop_event.set()
-        if self.process and self.process.poll() is None:
-            self.process.terminate()
-        
-        if self.statistics:
-            self.statistics.end_time = time.time()
-        
-        # Close log file
-        log_file.close()
+        # Main display loop, redrawn by _refresh_live_display only
+        try:
+            with Live(layout, console=self.console, auto_refresh=False, screen=True) as live:
+                try:
+                    _run_coroutine(self._run_process(cmd, log_file, layout, live))
+                except KeyboardInterrupt:
+                    self.console.print("\n[yellow]Interrupted by user, terminating process...[/yellow]")
+        finally:
+            # Cleanup
+            self.running = False
+            if self.statistics:
+                self.statistics.end_time = time.time()
+            
+            # Close log file
+            log_file.close()
         
         # Now display final summary
         self._display_final_output()
@@ -668,8 +915,8 @@ class RWLTool:
         # Display final info
         layout["info"].update(self._create_info_panel(is_final=True))
         
-        # Display final output panel with keyword highlighting
-        layout["output"].update(self._create_highlighted_output_panel())
+        # Display final output panel
+        layout["output"].update(self.output_panel.render())
         
         # Display the final screen
         self.console.clear()
@@ -686,32 +933,9 @@ class RWLTool:
         self.log_path = self._get_log_file_path(program_name)
         
         # Open log file
-        with open(self.log_path, 'w') as log_file:
-            # Start process
-            self.process = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                bufsize=1
-            )
-            
-            # Initialize statistics
-            self.statistics = Statistics(start_time=time.time())
-            
-            # Read output
-            while True:
-                stdout_line = self.process.stdout.readline()
-                stderr_line = self.process.stderr.readline()
-                
-                if not stdout_line and not stderr_line and self.process.poll() is not None:
-                    break
-                
-                if stdout_line:
-                    self._process_output_line(stdout_line.rstrip('\n'), log_file)
-                
-                if stderr_line:
-                    self._process_output_line(stderr_line.rstrip('\n'), log_file)
+        with open(self.log_path, 'w', buffering=_LOG_BUFFER_SIZE) as log_file:
+            # Start process and read its output
+            _run_coroutine(self._run_process(cmd, log_file))
             
             # Update statistics
             self.statistics.end_time = time.time()
@@ -745,6 +969,9 @@ class RWLTool:
     
     def config_interactive(self) -> None:
         """Interactive configuration management"""
+        inquirer = _import_inquirer()
+        from inquirer.themes import load_theme_from_dict
+        
         # Clear screen
         self.console.clear()
         
@@ -809,9 +1036,28 @@ class RWLTool:
         # Save configuration
         self._save_config()
     
+    def _invalidate_name_caches(self) -> None:
+        """Drop the cached config name lists after configs were added or removed"""
+        self._config_names_cached = None
+        self._deletable_names_cached = None
+    
+    def _get_config_names(self) -> List[str]:
+        """Get the names of all configs"""
+        if self._config_names_cached is None:
+            self._config_names_cached = list(self.configs.keys())
+        return self._config_names_cached
+    
+    def _get_deletable_names(self) -> List[str]:
+        """Get the names of all configs except default"""
+        if self._deletable_names_cached is None:
+            self._deletable_names_cached = [c for c in self._get_config_names() if c != "default"]
+        return self._deletable_names_cached
+    
     def _select_configuration(self) -> None:
         """Select a configuration to use"""
-        config_names = list(self.configs.keys())
+        inquirer = _import_inquirer()
+        
+        config_names = self._get_config_names()
         
         questions = [
             inquirer.List(
@@ -826,18 +1072,22 @@ class RWLTool:
             if answers:
                 self.current_config_name = answers['config']
                 self.current_config = self.configs[self.current_config_name]
+                self._rebuild_keyword_regex()
                 self.console.print(f"[green]✓ Switched to configuration: {self.current_config_name}[/green]")
         except KeyboardInterrupt:
             pass
     
     def _create_configuration(self) -> None:
         """Create a new configuration"""
+        inquirer = _import_inquirer()
+        
         questions = [
             inquirer.Text('name', message="Configuration name"),
             inquirer.Confirm('timestamp', message="Enable timestamps?", default=True),
             inquirer.Confirm('silent', message="Silent mode?", default=False),
             inquirer.Text('log_dir', message="Log directory", default="~/logs/"),
-            inquirer.Text('description', message="Description", default="")
+            inquirer.Text('description', message="Description", default=""),
+            inquirer.Confirm('switch', message="Switch to this configuration?", default=True)
         ]
         
         try:
@@ -855,19 +1105,23 @@ class RWLTool:
             
             # Add to configs
             self.configs[new_config.name] = new_config
+            self._invalidate_name_caches()
             self.console.print(f"[green]✓ Created configuration: {new_config.name}[/green]")
             
-            # Ask to switch to new config
-            if Confirm.ask("Switch to this configuration?"):
+            # Switch to new config if asked
+            if answers['switch']:
                 self.current_config_name = new_config.name
                 self.current_config = new_config
+                self._rebuild_keyword_regex()
         
         except KeyboardInterrupt:
             pass
     
     def _edit_configuration(self) -> None:
         """Edit a configuration using text editor"""
-        config_names = list(self.configs.keys())
+        inquirer = _import_inquirer()
+        
+        config_names = self._get_config_names()
         
         questions = [
             inquirer.List(
@@ -885,13 +1139,7 @@ class RWLTool:
             config_name = answers['config']
             
             # Try to open editor
-            editors = ['nvim', 'vim', 'vi', 'nano', 'code', 'subl']
-            editor = None
-            
-            for e in editors:
-                if self._which(e):
-                    editor = e
-                    break
+            editor = next((e for e in EDITORS if _which(e)), None)
             
             if not editor:
                 self.console.print("[red]Error: No suitable editor found[/red]")
@@ -899,36 +1147,51 @@ class RWLTool:
             
             # Create temporary file with config
             import tempfile
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-                config_dict = self.configs[config_name].to_dict()
-                yaml.dump(config_dict, f, default_flow_style=False)
+            yaml, loader, dumper = _import_yaml()
+            config_dict = self.configs[config_name].to_dict()
+            data = yaml.dump(config_dict, Dumper=dumper, default_flow_style=False).encode('utf-8')
+            before_hash = hashlib.blake2b(data).digest()
+            with tempfile.NamedTemporaryFile(mode='wb', suffix='.yaml', delete=False) as f:
+                f.write(data)
                 temp_path = f.name
             
-            # Open editor
-            subprocess.run([editor, temp_path])
+            # Open editor, it only needs stdio, so skip closing inherited fds
+            subprocess.run([editor, temp_path], check=False, close_fds=False,
+                           env=os.environ, start_new_session=False)
             
             # Read back changes
-            with open(temp_path, 'r') as f:
-                new_config_dict = yaml.safe_load(f)
-            
-            # Update config
-            self.configs[config_name] = Config.from_dict(config_name, new_config_dict)
+            with open(temp_path, 'rb') as f:
+                data = f.read()
             
             # Cleanup
             os.unlink(temp_path)
             
+            # Nothing to reparse if the file was left as it was
+            if hashlib.blake2b(data).digest() == before_hash:
+                self.console.print(f"[yellow]No changes to configuration: {config_name}[/yellow]")
+                return
+            
+            # Update config
+            new_config_dict = yaml.load(data, Loader=loader)
+            if not isinstance(new_config_dict, dict):
+                raise ValueError("Edited configuration is empty or not a mapping")
+            self.configs[config_name] = Config.from_dict(config_name, new_config_dict)
+            
             self.console.print(f"[green]✓ Updated configuration: {config_name}[/green]")
             
             # Update current if this is the current config
             if config_name == self.current_config_name:
                 self.current_config = self.configs[config_name]
+                self._rebuild_keyword_regex()
         
         except Exception as e:
             self.console.print(f"[red]Error editing configuration: {e}[/red]")
     
     def _delete_configuration(self) -> None:
         """Delete a configuration"""
-        config_names = [c for c in self.configs.keys() if c != "default"]
+        inquirer = _import_inquirer()
+        
+        config_names = self._get_deletable_names()
         
         if not config_names:
             self.console.print("[yellow]No configurations to delete (default cannot be deleted)[/yellow]")
@@ -950,11 +1213,13 @@ class RWLTool:
             
             config_name = answers['config']
             del self.configs[config_name]
+            self._invalidate_name_caches()
             
             # If we deleted the current config, switch to default
             if config_name == self.current_config_name:
                 self.current_config_name = "default"
                 self.current_config = self.configs["default"]
+                self._rebuild_keyword_regex()
             
             self.console.print(f"[green]✓ Deleted configuration: {config_name}[/green]")
         
@@ -967,28 +1232,28 @@ class RWLTool:
             self.console.print("[red]No configuration loaded[/red]")
             return
         
-        self.console.print("\n[bold cyan]Current Configuration:[/bold cyan]")
-        self.console.print(f"  Name: {self.current_config.name}")
-        self.console.print(f"  Description: {self.current_config.description}")
-        self.console.print(f"  Log Directory: {self.current_config.log_dir}")
-        self.console.print(f"  Timestamp: {'Enabled' if self.current_config.timestamp else 'Disabled'}")
-        self.console.print(f"  Silent Mode: {'Enabled' if self.current_config.silent else 'Disabled'}")
+        # Build the whole view first so it is written out in one go
+        lines = [
+            "\n[bold cyan]Current Configuration:[/bold cyan]",
+            f"  Name: {self.current_config.name}",
+            f"  Description: {self.current_config.description}",
+            f"  Log Directory: {self.current_config.log_dir}",
+            f"  Timestamp: {'Enabled' if self.current_config.timestamp else 'Disabled'}",
+            f"  Silent Mode: {'Enabled' if self.current_config.silent else 'Disabled'}"
+        ]
         
         if self.current_config.keywords:
-            self.console.print("\n  [bold]Keyword Highlighting:[/bold]")
-            for keyword, config in self.current_config.keywords.items():
-                status = "✓" if config.enabled else "✗"
-                self.console.print(f"    {keyword}: [{config.color}]{config.color}[/{config.color}] {status}")
+            lines.append("\n  [bold]Keyword Highlighting:[/bold]")
+            # Keyword lines only change with the config, build them once per config
+            if self.current_config._rendered_keywords is None:
+                self.current_config._rendered_keywords = "\n".join(
+                    f"    {keyword}: [{config.color}]{config.color}[/{config.color}] {'✓' if config.enabled else '✗'}"
+                    for keyword, config in self.current_config.keywords.items()
+                )
+            lines.append(self.current_config._rendered_keywords)
         
-        self.console.print()
-    
-    def _which(self, program: str) -> Optional[str]:
-        """Find executable in PATH"""
-        for path in os.environ.get("PATH", "").split(os.pathsep):
-            exe_path = Path(path) / program
-            if exe_path.exists() and os.access(exe_path, os.X_OK):
-                return str(exe_path)
-        return None
+        lines.append("")
+        self.console.print("\n".join(lines))
     
     def setting_interactive(self) -> None:
         """Interactive panel settings"""
@@ -996,127 +1261,64 @@ class RWLTool:
         
         current_height = self.settings.get("panel_height", 20)
         
-        questions = [
-            inquirer.Text(
-                'height',
-                message=f"Output panel height (current: {current_height})",
-                default=str(current_height),
-                validate=lambda _, x: x.isdigit() and 5 <= int(x) <= 50
-            )
-        ]
-        
+        # A single field, a plain prompt is enough
         try:
-            answers = inquirer.prompt(questions)
-            if answers:
-                new_height = int(answers['height'])
-                # Update settings
-                self.settings["panel_height"] = new_height
-                # Update output panel height
-                if self.output_panel:
-                    self.output_panel.height = new_height
-                # Save configuration
-                self._save_config()
-                self.console.print(f"[green]✓ Set panel height to {new_height}[/green]")
-        except KeyboardInterrupt:
+            while True:
+                value = input(f"Output panel height (5-50) [{current_height}]: ").strip() or str(current_height)
+                if value.isdigit() and 5 <= int(value) <= 50:
+                    break
+                self.console.print("[red]Please enter a number between 5 and 50[/red]")
+            
+            new_height = int(value)
+            # Update settings
+            self.settings["panel_height"] = new_height
+            # Update output panel height
+            if self.output_panel:
+                self.output_panel.height = new_height
+            # Save configuration in the background, the thread is joined at exit
+            threading.Thread(target=self._save_panel_height, args=(new_height,)).start()
+        except (KeyboardInterrupt, EOFError):
             pass
     
+    def _save_panel_height(self, new_height: int) -> None:
+        """Save the configuration after a panel height change and report the outcome"""
+        try:
+            self._save_config()
+        except Exception as e:
+            self.console.print(f"[red]Error saving panel height: {e}[/red]")
+            return
+        self.console.print(f"[green]✓ Set panel height to {new_height}[/green]")
+    
     def show_help(self) -> None:
         """Show help information"""
-        help_text = """
-[bold cyan]RWL - Run With Log[/bold cyan]
-A tool to capture and log program output with real-time display
-
-[bold]Usage:[/bold]
-  rwl [options] <command> [args...]
-  python run_with_log.py [options] <command> [args...]
-
-[bold]Options:[/bold]
-  -h, --help        Show this help message
-  --config          Interactive configuration management
-  --setting         Configure output panel settings
-
-[bold]Examples:[/bold]
-  rwl make all              # Run command with logging
-  rwl --config              # Open configuration manager
-  rwl --setting             # Configure panel settings
-  rwl gcc -o test test.c    # Compile with logging
-
-[bold]Features:[/bold]
-  • Real-time output capture and display
-  • Configurable logging profiles
-  • Keyword highlighting (errors, warnings, etc.)
-  • Statistics and metrics
-  • Silent mode for background operations
-  • Interactive configuration management
-  • Final summary display with all statistics
-
-[bold]Configuration:[/bold]
-  Configuration is stored in rwl.yaml in the same directory as the tool.
-  Multiple profiles can be created and switched between.
-
-[bold]Keyboard Controls:[/bold]
-  • Ctrl+C to interrupt the running process
-  • Output panel auto-scrolls to show latest output
-  • After process completion, press Enter to exit
-        """
-        
-        self.console.print(Panel(help_text, title="Help", border_style="cyan"))
+        _print_help_static(self.console)
 
 def main():
     """Main entry point"""
-    import argparse
-    
-    parser = argparse.ArgumentParser(
-        description="Run With Log - Capture and log program output",
-        add_help=False
-    )
-    
-    parser.add_argument(
-        '--config',
-        action='store_true',
-        help='Interactive configuration management'
-    )
+    # Only leading options belong to rwl, everything else is the command to run
+    argv = sys.argv[1:]
+    option = argv[0] if argv else None
     
-    parser.add_argument(
-        '--setting',
-        action='store_true',
-        help='Configure output panel settings'
-    )
-    
-    parser.add_argument(
-        '-h', '--help',
-        action='store_true',
-        help='Show help information'
-    )
-    
-    
-    # Parse known args first, leave command for rwl
-    args, remaining = parser.parse_known_args()
+    # Help is static, show it before loading any configuration
+    if option in ('-h', '--help') or not argv:
+        _print_help_static()
+        return 0
     
     # Create tool instance
     tool = RWLTool()
     
     # Handle options
-    if args.help:
-        tool.show_help()
-        return 0
-    
-    if args.config:
+    if option == '--config':
         tool.config_interactive()
         return 0
     
-    if args.setting:
+    if option == '--setting':
         tool.setting_interactive()
         return 0
     
-    # If no command provided, show help
-    if not remaining:
-        tool.show_help()
-        return 0
-    
     # Run command
     try:
-        return tool.run(remaining)
+        return tool.run(argv)
     except KeyboardInterrupt:
         tool.console.print("\n[yellow]Interrupted by user[/yellow]")
         return 130